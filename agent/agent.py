@@ -4,13 +4,20 @@ Agent Session Logic
 Manages the autonomous agent loop:
 - Fresh client per session to prevent context pollution
 - Detects first run (initialization) vs continuing (coding)
-- Auto-continues with configurable delay
+- Auto-continues into the next session immediately
 - Session handoff via Linear META issue
+
+Waiting convention: sleep once for the full delay rather than looping over
+short sleeps to poll. To only yield to the event loop, use
+`await asyncio.sleep(0)`, which CPython special-cases to skip arming a timer.
 """
 
 import asyncio
-from pathlib import Path
-from typing import Tuple
+import io
+import json
+import os
+import sys
+from typing import Any, Optional, Tuple
 
 from claude_code_sdk import (
     AssistantMessage,
@@ -21,25 +28,125 @@ from claude_code_sdk import (
 )
 
 from client import create_client
-from linear_config import LINEAR_PROJECT_MARKER
+from linear_config import LINEAR_PROJECT_MARKER, LINEAR_PROJECT_NAME
 from prompts import get_initializer_prompt, get_coding_prompt
 
 
-# Delay between auto-continue iterations (seconds)
-AUTO_CONTINUE_DELAY_SECONDS = 3
+# Exponential backoff between retries after a failed session (seconds)
+ERROR_RETRY_INITIAL_DELAY_SECONDS = 0.5
+ERROR_RETRY_MAX_DELAY_SECONDS = 10
+
+# How long streamed text is batched before it is written to stdout (seconds)
+OUTPUT_FLUSH_INTERVAL_SECONDS = 0.02
 
+# Queued after tool output so it is written without waiting for the batch
+_FLUSH_NOW = object()
 
-def is_linear_initialized(project_dir: str) -> bool:
-    """Check if Linear project has been initialized."""
-    marker_path = Path(project_dir) / LINEAR_PROJECT_MARKER
-    return marker_path.exists()
 
+async def _drain(out_q: "asyncio.Queue[Any]") -> None:
+    """
+    Write queued session output to stdout until a None sentinel arrives.
 
-def mark_linear_initialized(project_dir: str) -> None:
-    """Mark Linear project as initialized."""
-    marker_path = Path(project_dir) / LINEAR_PROJECT_MARKER
-    marker_path.parent.mkdir(parents=True, exist_ok=True)
-    marker_path.write_text('{"initialized": true, "project": "Home Service Agent"}')
+    Text is collected for up to OUTPUT_FLUSH_INTERVAL_SECONDS after the first
+    chunk and written with a single write + flush, so stdout is written far
+    less often than once per chunk. The write itself still runs on the event
+    loop. A _FLUSH_NOW marker writes the batch immediately.
+    """
+    loop = asyncio.get_running_loop()
+    closed = False
+    while not closed:
+        item = await out_q.get()
+        deadline = loop.time() + OUTPUT_FLUSH_INTERVAL_SECONDS
+        batch = []
+        while True:
+            if item is None:
+                closed = True
+                break
+            if item is _FLUSH_NOW:
+                break
+            batch.append(item)
+            try:
+                item = out_q.get_nowait()
+            except asyncio.QueueEmpty:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(out_q.get(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    break
+
+        if batch:
+            sys.stdout.write("".join(batch))
+            sys.stdout.flush()
+
+
+def get_linear_marker_path(project_dir: str) -> str:
+    """Get the path of the Linear initialization marker file."""
+    return os.path.join(project_dir, LINEAR_PROJECT_MARKER)
+
+
+def linear_marker_exists(marker_path: str) -> bool:
+    """Check if the Linear marker file exists (project initialized)."""
+    return os.path.exists(marker_path)
+
+
+def write_linear_marker(marker_path: str) -> None:
+    """Write the Linear marker file to mark the project as initialized."""
+    marker_dir = os.path.dirname(marker_path)
+    if marker_dir:
+        os.makedirs(marker_dir, exist_ok=True)
+    with open(marker_path, "w") as f:
+        json.dump(
+            {"initialized": True, "project": LINEAR_PROJECT_NAME},
+            f,
+            separators=(",", ":"),
+        )
+
+
+def _on_assistant_message(
+    message: AssistantMessage,
+    out_q: "asyncio.Queue[Any]",
+    full_response: io.StringIO
+) -> Optional[Tuple[str, str]]:
+    """Queue output for an assistant message; never ends the session."""
+    for block in message.content:
+        block_type = type(block)
+        if block_type is TextBlock:
+            out_q.put_nowait(block.text)
+            full_response.write(block.text)
+        elif block_type is ToolUseBlock:
+            out_q.put_nowait(f"\n[Tool: {block.name}]")
+            out_q.put_nowait(_FLUSH_NOW)
+        elif block_type is ToolResultBlock:
+            # Show abbreviated result
+            result_str = str(block.content) if block.content else ""
+            result_preview = result_str[:100]
+            if len(result_str) > 100:
+                result_preview += "..."
+            out_q.put_nowait(f" -> {result_preview}\n")
+            out_q.put_nowait(_FLUSH_NOW)
+    return None
+
+
+def _on_result_message(
+    message: ResultMessage,
+    out_q: "asyncio.Queue[Any]",
+    full_response: io.StringIO
+) -> Optional[Tuple[str, str]]:
+    """Handle the final result message, which ends the session."""
+    error = getattr(message, "error", None)
+    if error:
+        out_q.put_nowait(f"\n[Error: {error}]\n")
+        return ("error", str(error))
+    return ("success", full_response.getvalue())
+
+
+# Exact-type dispatch for SDK messages; other message types are ignored
+_MESSAGE_HANDLERS = {
+    AssistantMessage: _on_assistant_message,
+    ResultMessage: _on_result_message,
+}
 
 
 async def run_agent_session(
@@ -56,7 +163,9 @@ async def run_agent_session(
     """
     client = create_client(project_dir=project_dir, model=model)
 
-    full_response = []
+    full_response = io.StringIO()
+    out_q: "asyncio.Queue[Any]" = asyncio.Queue()
+    writer = asyncio.create_task(_drain(out_q))
 
     try:
         async with client:
@@ -64,34 +173,46 @@ async def run_agent_session(
             await client.query(prompt)
 
             # Receive and process the response
+            result = None
             async for message in client.receive_response():
-                if isinstance(message, AssistantMessage):
-                    for block in message.content:
-                        if isinstance(block, TextBlock):
-                            print(block.text, end="", flush=True)
-                            full_response.append(block.text)
-                        elif isinstance(block, ToolUseBlock):
-                            print(f"\n[Tool: {block.name}]", end="", flush=True)
-                        elif isinstance(block, ToolResultBlock):
-                            # Show abbreviated result
-                            result_str = str(block.content) if block.content else ""
-                            result_preview = result_str[:100]
-                            if len(result_str) > 100:
-                                result_preview += "..."
-                            print(f" -> {result_preview}", flush=True)
-
-                elif isinstance(message, ResultMessage):
-                    # Final result message
-                    if hasattr(message, 'error') and message.error:
-                        print(f"\n[Error: {message.error}]", flush=True)
-                        return ("error", str(message.error))
-
-        return ("success", "".join(full_response))
+                handler = _MESSAGE_HANDLERS.get(type(message))
+                if handler is None:
+                    continue
+                result = handler(message, out_q, full_response)
+                if result is not None:
+                    break
+
+        if result is not None:
+            return result
+        return ("success", full_response.getvalue())
 
     except KeyboardInterrupt:
         return ("interrupted", "User interrupted")
     except Exception as e:
         return ("error", str(e))
+    finally:
+        out_q.put_nowait(None)
+        await writer
+
+
+async def _prepare_prompt(project_dir: str, is_first_run: bool) -> str:
+    """Load the prompt for the next session without blocking the event loop."""
+    if is_first_run:
+        return await asyncio.to_thread(get_initializer_prompt, project_dir)
+    return await asyncio.to_thread(get_coding_prompt, project_dir)
+
+
+async def _prefetch_prompt(project_dir: str, is_first_run: bool) -> Optional[str]:
+    """
+    Prepare a prompt in the background while a session runs.
+
+    Returns None if loading fails for any reason; the foreground load then
+    retries and reports the error to the caller unwrapped.
+    """
+    try:
+        return await _prepare_prompt(project_dir, is_first_run)
+    except Exception:
+        return None
 
 
 async def run_autonomous_agent(
@@ -99,7 +220,9 @@ async def run_autonomous_agent(
     model: str,
     max_iterations: int = 100,
     init_only: bool = False,
-    skip_init: bool = False
+    skip_init: bool = False,
+    marker_path: Optional[str] = None,
+    is_first_run: Optional[bool] = None
 ) -> None:
     """
     Run the autonomous agent loop.
@@ -110,66 +233,94 @@ async def run_autonomous_agent(
     On subsequent runs:
         Uses coding prompt to pick up and implement highest-priority Todo issue
 
+    The next coding prompt is prefetched while each session runs.
+
     Args:
         skip_init: If True, skip initialization even if marker file doesn't exist
                    (useful for cloud deployment where Linear issues already exist)
+        marker_path: Path of the Linear marker file; derived from project_dir
+                     when not given
+        is_first_run: Initialization state already determined by the caller;
+                      when given, the marker file is not checked again
     """
     iteration = 0
-    # If skip_init is set, pretend we're already initialized
-    is_first_run = not is_linear_initialized(project_dir) and not skip_init
-
-    while iteration < max_iterations:
-        iteration += 1
-        print(f"\n{'='*60}")
-        print(f"Session {iteration} of {max_iterations}")
-        print(f"{'='*60}\n")
-
-        # Select prompt based on initialization state
-        if is_first_run:
-            print("Mode: INITIALIZER (creating Linear issues)")
-            prompt = get_initializer_prompt(project_dir)
-        else:
-            print("Mode: CODING (implementing next issue)")
-            prompt = get_coding_prompt(project_dir)
-
-        # Run the session
-        status, response = await run_agent_session(
-            project_dir=project_dir,
-            model=model,
-            prompt=prompt
-        )
-
-        print(f"\n\nSession ended with status: {status}")
-
-        if status == "interrupted":
-            print("User interrupted. Exiting...")
-            break
+    retry_delay = ERROR_RETRY_INITIAL_DELAY_SECONDS
+    if marker_path is None:
+        marker_path = get_linear_marker_path(project_dir)
+    if is_first_run is None:
+        # If skip_init is set, pretend we're already initialized
+        is_first_run = not skip_init and not linear_marker_exists(marker_path)
 
-        if status == "error":
-            print(f"Error occurred: {response}")
-            print("Waiting before retry...")
-            await asyncio.sleep(10)
-            continue
+    next_prompt_task: Optional["asyncio.Task[Optional[str]]"] = None
 
-        # After successful initialization, mark as initialized
-        if is_first_run:
-            mark_linear_initialized(project_dir)
-            is_first_run = False
-            print("\nLinear project initialized successfully!")
-
-            if init_only:
-                print("Init-only mode - exiting after initialization.")
+    try:
+        while iteration < max_iterations:
+            iteration += 1
+            print(f"\n{'='*60}")
+            print(f"Session {iteration} of {max_iterations}")
+            print(f"{'='*60}\n")
+
+            # Select prompt based on initialization state
+            if is_first_run:
+                print("Mode: INITIALIZER (creating Linear issues)")
+            else:
+                print("Mode: CODING (implementing next issue)")
+
+            prompt = None
+            if next_prompt_task is not None:
+                if is_first_run:
+                    # The prefetched coding prompt is not needed yet
+                    next_prompt_task.cancel()
+                else:
+                    prompt = await next_prompt_task
+            if prompt is None:
+                prompt = await _prepare_prompt(project_dir, is_first_run)
+
+            # Sessions after this one run in coding mode; prepare that prompt
+            # while the current session streams
+            next_prompt_task = asyncio.create_task(_prefetch_prompt(project_dir, False))
+
+            # Run the session
+            status, response = await run_agent_session(
+                project_dir=project_dir,
+                model=model,
+                prompt=prompt
+            )
+
+            print(f"\n\nSession ended with status: {status}")
+
+            if status == "interrupted":
+                print("User interrupted. Exiting...")
                 break
 
-        # Auto-continue with delay
-        print(f"\nAuto-continuing in {AUTO_CONTINUE_DELAY_SECONDS} seconds...")
-        print("(Press Ctrl+C to stop)")
-
-        try:
-            await asyncio.sleep(AUTO_CONTINUE_DELAY_SECONDS)
-        except KeyboardInterrupt:
-            print("\nStopping auto-continue. Exiting...")
-            break
+            if status == "error":
+                print(f"Error occurred: {response}")
+                print(f"Waiting {retry_delay:g} seconds before retry...")
+                await asyncio.sleep(retry_delay)
+                retry_delay = min(retry_delay * 2, ERROR_RETRY_MAX_DELAY_SECONDS)
+                continue
+
+            retry_delay = ERROR_RETRY_INITIAL_DELAY_SECONDS
+
+            # After successful initialization, mark as initialized
+            if is_first_run:
+                write_linear_marker(marker_path)
+                is_first_run = False
+                print("\nLinear project initialized successfully!")
+
+                if init_only:
+                    print("Init-only mode - exiting after initialization.")
+                    break
+
+            # The session has fully ended once run_agent_session returns, so
+            # continue straight into the next one
+            print("\nAuto-continuing...")
+            print("(Press Ctrl+C to stop)")
+
+    finally:
+        # Nothing will use a prefetch that is still pending
+        if next_prompt_task is not None:
+            next_prompt_task.cancel()
 
     print(f"\n{'='*60}")
     print("Autonomous agent completed")
@@ -18,8 +18,7 @@ from pathlib import Path
 
 from dotenv import load_dotenv
 
-from agent import run_autonomous_agent
-from linear_config import LINEAR_PROJECT_MARKER
+from agent import get_linear_marker_path, linear_marker_exists, run_autonomous_agent
 
 
 def main():
@@ -84,8 +83,8 @@ def main():
     print(f"Max iterations: {args.max_iterations}")
 
     # Check if this is first run (unless --skip-init is set)
-    marker_file = project_dir / LINEAR_PROJECT_MARKER
-    is_first_run = not marker_file.exists() and not args.skip_init
+    marker_path = get_linear_marker_path(str(project_dir))
+    is_first_run = not args.skip_init and not linear_marker_exists(marker_path)
 
     if args.skip_init:
         print("\nSkip-init mode - going straight to coding (for cloud deployment)")
@@ -104,7 +103,9 @@ def main():
                 model=args.model,
                 max_iterations=args.max_iterations,
                 init_only=args.init_only,
-                skip_init=args.skip_init
+                skip_init=args.skip_init,
+                marker_path=marker_path,
+                is_first_run=is_first_run
             )
         )
     except KeyboardInterrupt:
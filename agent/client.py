@@ -8,6 +8,8 @@ Configures:
 """
 
 import os
+import sys
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
 from claude_code_sdk import ClaudeCodeOptions, ClaudeSDKClient, HookMatcher
@@ -15,49 +17,108 @@ from claude_code_sdk import ClaudeCodeOptions, ClaudeSDKClient, HookMatcher
 from security import is_command_allowed, get_allowed_commands_list
 
 
+# Bash tool name, interned so comparisons against interned names hit identity
+_BASH_TOOL = sys.intern("Bash")
+
+# Hook responses that never change; returned as-is instead of built per call
+_ALLOW: Dict[str, Any] = {}
+
+_DENY_EMPTY_CMD: Dict[str, Any] = {
+    "hookSpecificOutput": {
+        "hookEventName": "PreToolUse",
+        "permissionDecision": "deny",
+        "permissionDecisionReason": "Empty command not allowed",
+    }
+}
+
+# Allowlist listed in deny messages; the allowlist is fixed at import
+_ALLOWED_COMMANDS_TEXT = ", ".join(get_allowed_commands_list())
+
+
 async def validate_bash_hook(input_data: Dict[str, Any], tool_use_id: str, context: Any) -> Dict[str, Any]:
     """
     PreToolUse hook to validate bash commands.
 
+    The SDK awaits hook callbacks, so this stays a coroutine, but it never
+    awaits anything itself and returns prebuilt responses where it can.
+
     Returns:
         Empty dict to allow, or permission denial dict to block.
     """
     tool_name = input_data.get("tool_name", "")
     tool_input = input_data.get("tool_input", {})
 
-    if tool_name != "Bash":
-        return {}  # Allow non-bash tools
+    # Equality (not `is`): tool names decoded from JSON are not guaranteed to
+    # be interned, and str comparison already short-circuits on identity
+    if tool_name != _BASH_TOOL:
+        return _ALLOW  # Allow non-bash tools
 
     command = tool_input.get("command", "")
     if not command:
-        return {
-            "hookSpecificOutput": {
-                "hookEventName": "PreToolUse",
-                "permissionDecision": "deny",
-                "permissionDecisionReason": "Empty command not allowed",
-            }
-        }
+        return _DENY_EMPTY_CMD
 
     is_allowed, reason = is_command_allowed(command)
     if not is_allowed:
-        allowed_cmds = ", ".join(get_allowed_commands_list())
         return {
             "hookSpecificOutput": {
                 "hookEventName": "PreToolUse",
                 "permissionDecision": "deny",
-                "permissionDecisionReason": f"Command blocked: {reason}. Allowed: {allowed_cmds}",
+                "permissionDecisionReason": f"Command blocked: {reason}. Allowed: {_ALLOWED_COMMANDS_TEXT}",
             }
         }
 
-    return {}  # Allow the command
-
-
-def create_options(
-    project_dir: str,
-    model: str = "claude-sonnet-4-20250514"
-) -> ClaudeCodeOptions:
+    return _ALLOW  # Allow the command
+
+
+# Tools the agent may use (constant across sessions)
+ALLOWED_TOOLS = tuple(sys.intern(tool) for tool in [
+    # File operations
+    "Read",
+    "Write",
+    "Edit",
+    "Glob",
+    "Grep",
+    "LS",
+
+    # Shell (with security validation via hook)
+    _BASH_TOOL,
+
+    # Task management
+    "TodoWrite",
+    "Task",
+
+    # Linear MCP tools
+    "mcp__linear__list_issues",
+    "mcp__linear__get_issue",
+    "mcp__linear__create_issue",
+    "mcp__linear__update_issue",
+    "mcp__linear__list_teams",
+    "mcp__linear__list_projects",
+    "mcp__linear__create_project",
+    "mcp__linear__create_comment",
+    "mcp__linear__list_issue_statuses",
+    "mcp__linear__list_issue_labels",
+    "mcp__linear__create_issue_label",
+])
+
+# Set view of ALLOWED_TOOLS for membership checks
+ALLOWED_TOOLS_SET = frozenset(ALLOWED_TOOLS)
+
+# Security hooks
+SECURITY_HOOKS = {
+    "PreToolUse": [
+        HookMatcher(matcher=_BASH_TOOL, hooks=[validate_bash_hook]),
+    ],
+}
+
+
+@lru_cache(maxsize=1)
+def get_mcp_servers() -> Dict[str, Any]:
     """
-    Create Claude Code options with MCP servers and hooks.
+    Build the MCP servers configuration.
+
+    LINEAR_API_KEY is read on first use rather than at import, since .env is
+    loaded after this module is imported. The result is shared by all sessions.
     """
     linear_api_key = os.environ.get("LINEAR_API_KEY", "")
 
@@ -75,50 +136,26 @@ def create_options(
             }
         }
 
-    # Define allowed tools
-    allowed_tools = [
-        # File operations
-        "Read",
-        "Write",
-        "Edit",
-        "Glob",
-        "Grep",
-        "LS",
-
-        # Shell (with security validation via hook)
-        "Bash",
-
-        # Task management
-        "TodoWrite",
-        "Task",
-
-        # Linear MCP tools
-        "mcp__linear__list_issues",
-        "mcp__linear__get_issue",
-        "mcp__linear__create_issue",
-        "mcp__linear__update_issue",
-        "mcp__linear__list_teams",
-        "mcp__linear__list_projects",
-        "mcp__linear__create_project",
-        "mcp__linear__create_comment",
-        "mcp__linear__list_issue_statuses",
-        "mcp__linear__list_issue_labels",
-        "mcp__linear__create_issue_label",
-    ]
-
-    # Security hooks
-    hooks = {
-        "PreToolUse": [
-            HookMatcher(matcher="Bash", hooks=[validate_bash_hook]),
-        ],
-    }
+    return mcp_servers
 
+
+@lru_cache(maxsize=8)
+def create_options(
+    project_dir: str,
+    model: str = "claude-sonnet-4-20250514"
+) -> ClaudeCodeOptions:
+    """
+    Create Claude Code options with MCP servers and hooks.
+
+    Options depend only on project_dir and model, so they are built once per
+    combination and shared across sessions.
+    """
     return ClaudeCodeOptions(
         model=model,
         cwd=project_dir,
-        allowed_tools=allowed_tools,
-        mcp_servers=mcp_servers,
-        hooks=hooks,
+        allowed_tools=list(ALLOWED_TOOLS),
+        mcp_servers=get_mcp_servers(),
+        hooks=SECURITY_HOOKS,
     )
 
 
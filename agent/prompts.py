@@ -5,17 +5,22 @@ Loads and prepares prompts for the autonomous agent.
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 
+_PROMPTS_DIR = Path(__file__).parent / "prompts"
+
+
 def get_prompts_dir() -> Path:
     """Get the prompts directory path."""
-    return Path(__file__).parent / "prompts"
+    return _PROMPTS_DIR
 
 
+@lru_cache(maxsize=16)
 def load_prompt_file(filename: str) -> str:
-    """Load a prompt file from the prompts directory."""
+    """Load a prompt file from the prompts directory (cached for the run)."""
     prompt_path = get_prompts_dir() / filename
     if not prompt_path.exists():
         raise FileNotFoundError(f"Prompt file not found: {prompt_path}")
@@ -27,6 +32,13 @@ def load_app_spec() -> str:
     return load_prompt_file("app_spec.txt")
 
 
+@lru_cache(maxsize=1)
+def _load_initializer_template() -> str:
+    """Load the initializer prompt with the app spec already injected."""
+    base_prompt = load_prompt_file("initializer_prompt.md")
+    return base_prompt.replace("{{APP_SPEC}}", load_app_spec())
+
+
 def get_initializer_prompt(project_dir: str) -> str:
     """
     Get the initializer prompt for creating Linear issues.
@@ -38,12 +50,8 @@ def get_initializer_prompt(project_dir: str) -> str:
     4. Create a META issue for tracking
     5. Set up init.sh and git
     """
-    base_prompt = load_prompt_file("initializer_prompt.md")
-    app_spec = load_app_spec()
-
-    # Inject app spec into the prompt
-    prompt = base_prompt.replace("{{APP_SPEC}}", app_spec)
-    prompt = prompt.replace("{{PROJECT_DIR}}", project_dir)
+    # App spec is static, so only the project directory is injected per call
+    prompt = _load_initializer_template().replace("{{PROJECT_DIR}}", project_dir)
 
     return prompt
 
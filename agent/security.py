@@ -5,11 +5,13 @@ Implements allowlist-based security for shell commands.
 Only explicitly allowed commands can be executed.
 """
 
+import re
 import shlex
-from typing import Tuple, Set
+from functools import lru_cache
+from typing import FrozenSet, Tuple
 
 # Commands that are safe for autonomous agent use
-ALLOWED_COMMANDS: Set[str] = {
+ALLOWED_COMMANDS: FrozenSet[str] = frozenset({
     # File operations (read-only or safe)
     "ls",
     "cat",
@@ -53,7 +55,7 @@ ALLOWED_COMMANDS: Set[str] = {
     # Build tools
     "esbuild",
     "vite",
-}
+})
 
 # Patterns that are always blocked regardless of command
 BLOCKED_PATTERNS = [
@@ -80,6 +82,18 @@ BLOCKED_PATTERNS = [
     ">/dev/null 2>&1 &",  # Background execution hiding output
 ]
 
+# All blocked patterns compiled into one matcher so a command is scanned once
+# instead of once per pattern. Maps the lowercased match back to the pattern.
+_BLOCKED_BY_LOWER = {pattern.lower(): pattern for pattern in BLOCKED_PATTERNS}
+_BLOCKED_RE = re.compile("|".join(re.escape(p) for p in _BLOCKED_BY_LOWER))
+
+# First token after any leading VAR=value environment assignments. Like the
+# original token loop, the command token may only contain "=" if it starts
+# with "-", so assignment-only commands never parse as a command.
+_COMMAND_NAME_RE = re.compile(
+    r"\s*(?:[A-Za-z_][A-Za-z0-9_]*=\S*\s+)*(-\S*|[^\s=]+)(?!\S)"
+)
+
 
 def get_command_name(command: str) -> str:
     """
@@ -90,30 +104,32 @@ def get_command_name(command: str) -> str:
     - Environment variables: "NODE_ENV=test npm run" -> "npm"
     - Paths: "/usr/bin/node script.js" -> "node"
     """
-    # Remove leading environment variable assignments
-    parts = command.strip().split()
-    for i, part in enumerate(parts):
-        if "=" not in part or part.startswith("-"):
-            # Found the actual command
-            cmd = parts[i] if i < len(parts) else ""
-            # Remove path prefix
-            return cmd.split("/")[-1]
-    return ""
+    match = _COMMAND_NAME_RE.match(command)
+    if not match:
+        return ""
+    head = match.group(1)
+
+    # Remove path prefix
+    slash = head.rfind("/")
+    return head[slash + 1:] if slash >= 0 else head
 
 
 def contains_blocked_pattern(command: str) -> Tuple[bool, str]:
     """Check if command contains any blocked patterns."""
-    command_lower = command.lower()
-    for pattern in BLOCKED_PATTERNS:
-        if pattern.lower() in command_lower:
-            return True, f"Contains blocked pattern: {pattern}"
+    match = _BLOCKED_RE.search(command.lower())
+    if match:
+        return True, f"Contains blocked pattern: {_BLOCKED_BY_LOWER[match.group()]}"
     return False, ""
 
 
+@lru_cache(maxsize=1024)
 def is_command_allowed(command: str) -> Tuple[bool, str]:
     """
     Check if a bash command is allowed.
 
+    Results are memoized: the allowlist and blocked-pattern matcher are fixed
+    at import time. Call is_command_allowed.cache_clear() if either is rebuilt.
+
     Returns:
         Tuple of (is_allowed: bool, reason: str)
     """